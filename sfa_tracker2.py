@@ -9,6 +9,8 @@ This is a reusable “show tracker” script (same pattern as the Starfleet Acad
 - Comment history snapshots for time-series plots (re-run on a schedule)
 - Polite, no-auth Reddit JSON search (best-effort, rate-limit aware)
 
+Requires: requests, matplotlib, pandas>=2.0 (plots); orjson is optional (faster JSON decode).
+
 Usage (PowerShell):
   $env:SHOW_SLUG="Starfleet_Academy"
   $env:SHOW_NAME="Starfleet_Academy"
@@ -21,20 +23,37 @@ Optional env:
   OTHER_N=5
   SORT=new            # new | top | relevance
   T=all               # all | year | month | week | day
+  FETCH_WORKERS=4     # concurrent search requests (keep small; Reddit rate-limits)
+  INCREMENTAL=0       # 1 = only fetch posts newer than the last run (per subreddit/term)
+  MAX_PAGES=5         # incremental mode: max pages to follow back to the saved cursor
   USER_AGENT="RewindOS-SubTracker/1.0 (personal project; respectful polling)"
 """
 
 import csv
+import heapq
+import json
 import logging
 import os
+import random
 import re
 import sys
+import threading
 import time
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Tuple
+from html import escape
+from operator import attrgetter
+from typing import Iterable, Optional, List, Tuple
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson  # optional: faster JSON decode for search responses
+except ImportError:
+    orjson = None
 
 
 # -----------------------------
@@ -55,6 +74,12 @@ LIMIT = int(os.environ.get("LIMIT", "100"))
 OTHER_POSTS_N = int(os.environ.get("OTHER_N", "5"))
 SORT = os.environ.get("SORT", "new")
 TIME_FILTER = os.environ.get("T", "all")
+FETCH_WORKERS = max(1, int(os.environ.get("FETCH_WORKERS", "4")))
+
+# Incremental mode skips posts already seen in earlier runs, so older posts stop
+# getting comment-count snapshots; leave it off when you want growth plots.
+INCREMENTAL = os.environ.get("INCREMENTAL", "0").strip() == "1"
+MAX_PAGES = max(1, int(os.environ.get("MAX_PAGES", "5")))
 
 USER_AGENT = os.environ.get(
     "USER_AGENT",
@@ -69,6 +94,11 @@ TRAILER_KEYWORDS = [
     "teaser",
 ]
 
+# Lowercased once at import; looks_like_trailer runs for every fetched title
+SHOW_NAME_LC = SHOW_NAME.lower()
+_QUERY_TERMS_LC = tuple(q.strip('"').lower() for q in QUERY_TERMS if q)
+_TRAILER_KW_LC = tuple(k.lower() for k in TRAILER_KEYWORDS)
+
 
 # -----------------------------
 # Paths (consistent RewindOS layout)
@@ -88,6 +118,7 @@ ALL_POSTS_CSV = os.path.join(OUT_DIR, f"{SHOW_SLUG}_all_posts.csv")
 EPISODE_POSTS_CSV = os.path.join(OUT_DIR, f"{SHOW_SLUG}_episode_posts.csv")
 SELECTED_POSTS_CSV = os.path.join(OUT_DIR, f"{SHOW_SLUG}_selected_posts.csv")
 COMMENT_HISTORY_CSV = os.path.join(DATA_DIR, f"{SHOW_SLUG}_comment_history.csv")
+FETCH_CURSOR_JSON = os.path.join(DATA_DIR, f"{SHOW_SLUG}_cursor.json")
 
 EPISODE_PLOT_PNG = os.path.join(OUT_DIR, f"{SHOW_SLUG}_episode_comment_growth.png")
 NON_EPISODE_PLOT_PNG = os.path.join(OUT_DIR, f"{SHOW_SLUG}_non_episode_comment_growth.png")
@@ -117,20 +148,25 @@ def safe_int(x, default=0):
 
 
 def norm_spaces(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+    return " ".join((s or "").split())
 
 
 # -----------------------------
 # Episode parsing (expanded)
 # -----------------------------
-EP_PATTERNS = [
+# One pattern, anchored with .match(): each branch scans the whole title before the
+# next is tried, so 1x01 beats S01E01 beats "Episode 3" wherever they appear.
+EP_COMBINED = re.compile(
+    r"(?:"
     # 1x01, 1X02, 10x3 (normalize)
-    re.compile(r"\b(\d{1,2})\s*[xX]\s*(\d{1,2})\b"),
+    r".*?\b(?P<sxe_s>\d{1,2})\s*x\s*(?P<sxe_e>\d{1,2})\b"
     # S01E01, s1e2
-    re.compile(r"\b[Ss](\d{1,2})\s*[Ee](\d{1,2})\b"),
+    r"|.*?\bs(?P<se_s>\d{1,2})\s*e(?P<se_e>\d{1,2})\b"
     # "Episode 3", "Ep 3", "Ep. 3"
-    re.compile(r"\b(?:episode|ep)\.?\s*(\d{1,2})\b", re.IGNORECASE),
-]
+    r"|.*?\b(?:episode|ep)\.?\s*(?P<ep>\d{1,2})\b"
+    r")",
+    re.IGNORECASE | re.DOTALL,
+)
 
 
 def extract_episode_code(title: str) -> Optional[str]:
@@ -139,46 +175,39 @@ def extract_episode_code(title: str) -> Optional[str]:
       - "1x02" for season/episode patterns when available
       - "E03" for episode-only patterns (no season info)
     """
-    t = title or ""
-    for pat in EP_PATTERNS:
-        m = pat.search(t)
-        if not m:
-            continue
-
-        if pat.pattern.lower().find("[xX]") != -1 or "Ss" in pat.pattern or "Ee" in pat.pattern:
-            # season/episode
-            season = int(m.group(1))
-            ep = int(m.group(2))
-            return f"{season}x{ep:02d}"
+    m = EP_COMBINED.match(title or "")
+    if not m:
+        return None
 
-        # episode-only
-        ep_only = int(m.group(1))
-        return f"E{ep_only:02d}"
+    gd = m.groupdict()
+    if gd["sxe_s"] is not None:
+        return f"{int(gd['sxe_s'])}x{int(gd['sxe_e']):02d}"
+    if gd["se_s"] is not None:
+        return f"{int(gd['se_s'])}x{int(gd['se_e']):02d}"
 
-    return None
+    # episode-only
+    return f"E{int(gd['ep']):02d}"
 
 
 def looks_like_trailer(title: str) -> bool:
     t = (title or "").lower()
     # must contain show name OR one of the query terms (loose)
-    show_hit = (SHOW_NAME.lower() in t) or any(q.strip('"').lower() in t for q in QUERY_TERMS if q)
-    if not show_hit:
+    if SHOW_NAME_LC not in t and not any(q in t for q in _QUERY_TERMS_LC):
         return False
 
     # trailer-ish keywords
-    return any(k in t for k in TRAILER_KEYWORDS)
+    return any(k in t for k in _TRAILER_KW_LC)
 
 
 # -----------------------------
 # Data model
 # -----------------------------
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Post:
     id: str
     name: str
     subreddit: str
     created_utc: int
-    created_iso: str
     title: str
     permalink: str
     url: str
@@ -187,6 +216,15 @@ class Post:
     num_comments: int
     episode_code: Optional[str]
     is_trailer: bool
+    _created_iso: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @property
+    def created_iso(self) -> str:
+        # formatted on first use, then cached (several writers read it per post)
+        if self._created_iso is None:
+            iso = datetime.fromtimestamp(self.created_utc, tz=timezone.utc).isoformat() if self.created_utc else ""
+            object.__setattr__(self, "_created_iso", iso)
+        return self._created_iso
 
 
 # -----------------------------
@@ -197,27 +235,86 @@ def build_session() -> requests.Session:
     session.headers.update({
         "User-Agent": USER_AGENT,
         "Accept": "application/json,text/plain,*/*",
+        "Accept-Encoding": "gzip, deflate",
         "Accept-Language": "en-US,en;q=0.9",
         "Cache-Control": "no-cache",
         "Pragma": "no-cache",
     })
+    # keep-alive pool sized for the fetch workers; retries are handled in request_json
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=max(16, FETCH_WORKERS),
+        max_retries=Retry(total=0),
+    )
+    session.mount("https://", adapter)
     return session
 
 
+_SESSION: Optional[requests.Session] = None
+
+
+def get_session() -> requests.Session:
+    """Shared session so every request (and worker thread) reuses pooled connections."""
+    global _SESSION
+    if _SESSION is None:
+        _SESSION = build_session()
+    return _SESSION
+
+
+class RateLimiter:
+    """
+    Pauses all fetch workers together when Reddit reports the request budget is
+    nearly spent (X-Ratelimit-Remaining / X-Ratelimit-Reset), instead of running
+    into 429s and backing off.
+    """
+
+    def __init__(self, min_remaining: float = 2):
+        self.min_remaining = min_remaining
+        self._lock = threading.Lock()
+        self._resume_at = 0.0
+
+    def wait(self):
+        with self._lock:
+            delay = self._resume_at - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+
+    def update(self, headers):
+        try:
+            remaining = float(headers.get("X-Ratelimit-Remaining", "999"))
+            reset = float(headers.get("X-Ratelimit-Reset", "0"))
+        except ValueError:
+            return
+        if remaining < self.min_remaining and reset > 0:
+            with self._lock:
+                self._resume_at = max(self._resume_at, time.monotonic() + reset + 1)
+            logging.info(f"Rate limit nearly spent ({remaining:g} left); pausing requests {reset + 1:g}s.")
+
+
+RATE_LIMITER = RateLimiter()
+
+
+def backoff_seconds(attempt: int) -> float:
+    # capped exponential (1, 2, 4, ... 60s) with jitter so parallel workers don't retry in lockstep
+    return min(60, 1 << (attempt - 1)) * (0.5 + random.random() / 2)
+
+
 def request_json(session: requests.Session, url: str, params: dict, max_retries: int = 5) -> dict:
     for attempt in range(1, max_retries + 1):
+        RATE_LIMITER.wait()
         r = session.get(url, params=params, timeout=30, allow_redirects=True)
+        RATE_LIMITER.update(r.headers)
 
         if r.status_code == 429:
             retry_after = r.headers.get("Retry-After")
-            wait = int(retry_after) if retry_after and retry_after.isdigit() else min(60, 2 ** attempt)
-            logging.warning(f"HTTP 429 rate-limited. Waiting {wait}s (attempt {attempt}/{max_retries})...")
+            wait = int(retry_after) if retry_after and retry_after.isdigit() else backoff_seconds(attempt)
+            logging.warning(f"HTTP 429 rate-limited. Waiting {wait:.1f}s (attempt {attempt}/{max_retries})...")
             time.sleep(wait)
             continue
 
         if 500 <= r.status_code < 600:
-            wait = min(60, 2 ** attempt)
-            logging.warning(f"HTTP {r.status_code}. Waiting {wait}s (attempt {attempt}/{max_retries})...")
+            wait = backoff_seconds(attempt)
+            logging.warning(f"HTTP {r.status_code}. Waiting {wait:.1f}s (attempt {attempt}/{max_retries})...")
             time.sleep(wait)
             continue
 
@@ -227,19 +324,50 @@ def request_json(session: requests.Session, url: str, params: dict, max_retries:
         if "json" not in ct:
             raise ValueError(f"Expected JSON but got Content-Type={ct}. Final URL: {r.url}")
 
-        return r.json()
+        return orjson.loads(r.content) if orjson is not None else r.json()
 
     raise RuntimeError("Failed after retries (rate-limited or server errors).")
 
 
+# -----------------------------
+# Fetch cursor (incremental mode)
+# -----------------------------
+def cursor_key(sr: str, term: str) -> str:
+    return f"{sr}|{term}"
+
+
+def load_cursor() -> dict:
+    """Maps "subreddit|term" -> newest created_utc seen on a previous run."""
+    if not os.path.exists(FETCH_CURSOR_JSON):
+        return {}
+    try:
+        with open(FETCH_CURSOR_JSON, "r", encoding="utf-8") as f:
+            return {k: safe_int(v, 0) for k, v in json.load(f).items()}
+    except Exception:
+        logging.warning(f"Could not read {FETCH_CURSOR_JSON}; starting without a cursor.")
+        return {}
+
+
+def save_cursor(cursor: dict):
+    with open(FETCH_CURSOR_JSON, "w", encoding="utf-8") as f:
+        json.dump(cursor, f, indent=2, sort_keys=True)
+
+
 # -----------------------------
 # Reddit fetch (multi-subreddit, multi-term)
 # -----------------------------
-def fetch_search_posts() -> List[Post]:
-    session = build_session()
+def fetch_search_posts(cursor: Optional[dict] = None) -> List[Post]:
+    """
+    When a cursor dict is given (incremental mode), each subreddit/term search only
+    returns posts newer than its saved created_utc, and the dict is updated in place
+    with the newest created_utc seen. The caller saves it once the run is recorded.
+    """
+    session = get_session()
     posts: List[Post] = []
     seen_ids: set[str] = set()
 
+    # one task per (subreddit, term); requests are I/O-bound so run them concurrently
+    tasks = []
     for sr in SUBREDDITS:
         search_url = f"https://www.reddit.com/r/{sr}/search.json"
 
@@ -253,20 +381,75 @@ def fetch_search_posts() -> List[Post]:
                 "limit": LIMIT,
                 "raw_json": 1,
             }
-
-            logging.info(f"Searching r/{sr} for {q!r} (limit={LIMIT}, sort={SORT}, t={TIME_FILTER})")
+            since = (cursor or {}).get(cursor_key(sr, term), 0)
+            if since:
+                # newest-first so we can stop at the first already-seen post
+                params["sort"] = "new"
+            tasks.append((sr, cursor_key(sr, term), search_url, params, since))
+
+    def run_search(sr: str, search_url: str, params: dict, since: int) -> Tuple[list, bool]:
+        """Returns (children, complete); complete is False if MAX_PAGES ran out before `since`."""
+        logging.info(
+            f"Searching r/{sr} for {params['q']!r} "
+            f"(limit={LIMIT}, sort={params['sort']}, t={TIME_FILTER}, since={since or '-'})"
+        )
+        children = []
+        for _ in range(MAX_PAGES if since else 1):
             data = request_json(session, search_url, params=params)
+            listing = data.get("data") or {}
+            for ch in listing.get("children") or []:
+                if since and safe_int((ch.get("data") or {}).get("created_utc"), 0) <= since:
+                    return children, True
+                children.append(ch)
+
+            after = listing.get("after")
+            if not after:
+                break
+            params = {**params, "after": after}
+        else:
+            if since:
+                return children, False
+        return children, True
+
+    with ThreadPoolExecutor(max_workers=min(FETCH_WORKERS, len(tasks) or 1)) as ex:
+        futures = [
+            (sr, key, ex.submit(run_search, sr, url, params, since))
+            for (sr, key, url, params, since) in tasks
+        ]
+
+        # merge in task order so de-dup attribution stays deterministic
+        for sr, key, fut in futures:
+            try:
+                children, complete = fut.result()
+            except Exception:
+                # fail fast like the sequential loop did: drop searches that haven't started
+                ex.shutdown(wait=False, cancel_futures=True)
+                raise
+
+            if not complete:
+                # posts between the last page and the cursor were not fetched; keep the
+                # cursor where it is so the next run retries instead of skipping them
+                logging.warning(
+                    f"r/{sr} {key.split('|', 1)[1]!r}: hit MAX_PAGES={MAX_PAGES} before reaching the saved "
+                    f"cursor; posts in between were not fetched. Cursor not advanced (raise MAX_PAGES to catch up)."
+                )
+            elif cursor is not None and children:
+                newest = max(safe_int((ch.get("data") or {}).get("created_utc"), 0) for ch in children)
+                if newest > cursor.get(key, 0):
+                    cursor[key] = newest
 
-            children = (data.get("data") or {}).get("children") or []
             for ch in children:
                 d = ch.get("data") or {}
                 pid = d.get("id")
-                if not pid or pid in seen_ids:
+                if not pid:
                     continue
+                # single hash/probe: add, then check whether the set grew
+                before = len(seen_ids)
                 seen_ids.add(pid)
+                if len(seen_ids) == before:
+                    continue
 
                 created_utc = safe_int(d.get("created_utc"), 0)
-                created_iso = datetime.fromtimestamp(created_utc, tz=timezone.utc).isoformat() if created_utc else ""
 
                 title = d.get("title") or ""
                 ep = extract_episode_code(title)
@@ -277,7 +460,6 @@ def fetch_search_posts() -> List[Post]:
                     name=d.get("name") or f"t3_{pid}",
                     subreddit=d.get("subreddit") or sr,
                     created_utc=created_utc,
-                    created_iso=created_iso,
                     title=norm_spaces(title),
                     permalink="https://www.reddit.com" + (d.get("permalink") or ""),
                     url=d.get("url") or "",
@@ -289,7 +471,7 @@ def fetch_search_posts() -> List[Post]:
                 ))
 
     # newest first (useful default)
-    posts.sort(key=lambda p: p.created_utc, reverse=True)
+    posts.sort(key=attrgetter("created_utc"), reverse=True)
     logging.info(f"Found {len(posts)} unique posts across subreddits/terms.")
     return posts
 
@@ -297,47 +479,51 @@ def fetch_search_posts() -> List[Post]:
 # -----------------------------
 # CSV writers
 # -----------------------------
-def write_csv(path: str, rows: List[dict], fieldnames: List[str]):
+def write_csv(path: str, rows: Iterable[tuple], fieldnames: List[str]):
+    # rows are tuples in fieldnames order
     with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=fieldnames)
-        w.writeheader()
-        for r in rows:
-            w.writerow(r)
+        w = csv.writer(f)
+        w.writerow(fieldnames)
+        w.writerows(rows)
+
+
+HISTORY_FIELDS = [
+    "snapshot_utc", "post_id", "post_name", "subreddit",
+    "episode_code", "is_episode", "is_trailer",
+    "title", "permalink", "num_comments"
+]
+
+
+# paths whose history header is known to exist, so repeat calls skip the stat
+_HISTORY_HEADER_OK: set[str] = set()
 
 
 def ensure_history_header(path: str):
-    if os.path.exists(path):
+    if path in _HISTORY_HEADER_OK:
         return
-    with open(path, "w", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=[
-            "snapshot_utc", "post_id", "post_name", "subreddit",
-            "episode_code", "is_episode", "is_trailer",
-            "title", "permalink", "num_comments"
-        ])
-        w.writeheader()
+    if not os.path.exists(path):
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            csv.writer(f).writerow(HISTORY_FIELDS)
+    _HISTORY_HEADER_OK.add(path)
 
 
 def append_history(snapshot_utc: str, posts: List[Post]):
     ensure_history_header(COMMENT_HISTORY_CSV)
-    with open(COMMENT_HISTORY_CSV, "a", newline="", encoding="utf-8") as f:
-        w = csv.DictWriter(f, fieldnames=[
-            "snapshot_utc", "post_id", "post_name", "subreddit",
-            "episode_code", "is_episode", "is_trailer",
-            "title", "permalink", "num_comments"
-        ])
-        for p in posts:
-            w.writerow({
-                "snapshot_utc": snapshot_utc,
-                "post_id": p.id,
-                "post_name": p.name,
-                "subreddit": p.subreddit,
-                "episode_code": p.episode_code or "",
-                "is_episode": 1 if p.episode_code else 0,
-                "is_trailer": 1 if p.is_trailer else 0,
-                "title": p.title,
-                "permalink": p.permalink,
-                "num_comments": p.num_comments,
-            })
+    # columns follow HISTORY_FIELDS order
+    rows = [(
+        snapshot_utc,
+        p.id,
+        p.name,
+        p.subreddit,
+        p.episode_code or "",
+        1 if p.episode_code else 0,
+        1 if p.is_trailer else 0,
+        p.title,
+        p.permalink,
+        p.num_comments,
+    ) for p in posts]
+    with open(COMMENT_HISTORY_CSV, "a", newline="", encoding="utf-8", buffering=1 << 20) as f:
+        csv.writer(f).writerows(rows)
 
 
 # -----------------------------
@@ -348,67 +534,81 @@ def pick_trailer(posts: List[Post]) -> Optional[Post]:
     if not trailers:
         return None
     # pick “most discussed”, tiebreaker by score
-    return sorted(trailers, key=lambda p: (p.num_comments, p.score), reverse=True)[0]
+    return max(trailers, key=attrgetter("num_comments", "score"))
 
 
 def episode_posts(posts: List[Post]) -> List[Post]:
     eps = [p for p in posts if p.episode_code]
-    # sort episode code then created (stable)
-    eps.sort(key=lambda p: (p.episode_code or "", p.created_utc))
+    # sort episode code then created (stable); episode_code is always set here
+    eps.sort(key=attrgetter("episode_code", "created_utc"))
     return eps
 
 
 def pick_other_posts(posts: List[Post], n: int) -> List[Post]:
     # exclude episode + trailer
     candidates = [p for p in posts if not p.episode_code and not p.is_trailer]
-    candidates = sorted(candidates, key=lambda p: (p.num_comments, p.score), reverse=True)
-    return candidates[:n]
+    # top n without sorting the whole list (same order/ties as sorted(..., reverse=True)[:n])
+    return heapq.nlargest(n, candidates, key=attrgetter("num_comments", "score"))
 
 
 # -----------------------------
 # Plotting
 # -----------------------------
 def make_plots():
-    import matplotlib.pyplot as plt
-
     if not os.path.exists(COMMENT_HISTORY_CSV):
         logging.warning("No comment history yet; skipping plots. Re-run over time to build history.")
         return
 
-    history_rows = []
-    with open(COMMENT_HISTORY_CSV, "r", newline="", encoding="utf-8") as f:
-        r = csv.DictReader(f)
-        for row in r:
-            history_rows.append(row)
+    # nothing appended since the last render: keep the existing PNGs (and skip the imports).
+    # Either plot may be absent (e.g. no episode threads yet), so check whichever exist.
+    history_mtime = os.path.getmtime(COMMENT_HISTORY_CSV)
+    existing_pngs = [png for png in (EPISODE_PLOT_PNG, NON_EPISODE_PLOT_PNG) if os.path.exists(png)]
+    if existing_pngs and all(os.path.getmtime(png) >= history_mtime for png in existing_pngs):
+        logging.info("Comment history unchanged since last plot; skipping plots.")
+        return
 
-    def parse_dt(s: str):
-        try:
-            return datetime.fromisoformat(s)
-        except Exception:
-            return None
-
-    by_post: Dict[str, List[Tuple[datetime, int, dict]]] = {}
-    for row in history_rows:
-        dt = parse_dt(row["snapshot_utc"])
-        if not dt:
-            continue
-        post_name = row["post_name"]
-        num_comments = safe_int(row["num_comments"], 0)
-        by_post.setdefault(post_name, []).append((dt, num_comments, row))
+    import matplotlib
+    matplotlib.use("Agg")  # file-only rendering; no GUI backend on headless/scheduled runs
+    import matplotlib.pyplot as plt
+    try:
+        import pandas as pd
+    except ImportError:
+        pd = None
+    if pd is None or safe_int(pd.__version__.split(".")[0], 0) < 2:
+        logging.error("pandas>=2.0 is required for plots (pip install \"pandas>=2.0\"); skipping plots.")
+        return
+
+    plt.rcParams["path.simplify"] = True
+    plt.rcParams["agg.path.chunksize"] = 10000
+
+    # read everything as text ("" for blanks) so episode codes / flags compare as written
+    # only the columns the plots use
+    df = pd.read_csv(
+        COMMENT_HISTORY_CSV,
+        usecols=["snapshot_utc", "post_name", "episode_code", "is_episode", "title", "num_comments"],
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+    # every post in a snapshot shares the same timestamp string; cache parses each one once
+    df["snapshot_utc"] = pd.to_datetime(
+        df["snapshot_utc"], errors="coerce", utc=True, format="ISO8601", cache=True
+    )
+    df = df.dropna(subset=["snapshot_utc"])
+    df["num_comments"] = pd.to_numeric(df["num_comments"], errors="coerce").fillna(0).astype(int)
+    df = df.sort_values("snapshot_utc", kind="stable")
 
-    for k in list(by_post.keys()):
-        by_post[k].sort(key=lambda x: x[0])
+    # a post is an episode thread if its earliest snapshot says so
+    groups = list(df.groupby("post_name", sort=False))
+    ep_groups = [(name, g) for name, g in groups if g["is_episode"].iat[0] == "1"]
+    non_groups = [(name, g) for name, g in groups if g["is_episode"].iat[0] != "1"]
 
     # Episode plot
     plt.figure()
     plotted_any = False
-    for post_name, series in by_post.items():
-        if series[0][2].get("is_episode") != "1":
-            continue
-        x = [t for (t, _, __) in series]
-        y = [c for (_, c, __) in series]
-        label = series[0][2].get("episode_code") or post_name
-        plt.plot(x, y, label=label)
+    for post_name, g in ep_groups:
+        label = g["episode_code"].iat[0] or post_name
+        plt.plot(g["snapshot_utc"], g["num_comments"], label=label)
         plotted_any = True
 
     if plotted_any:
@@ -427,14 +627,10 @@ def make_plots():
     # Non-episode plot
     plt.figure()
     plotted_any = False
-    for post_name, series in by_post.items():
-        if series[0][2].get("is_episode") == "1":
-            continue
-        x = [t for (t, _, __) in series]
-        y = [c for (_, c, __) in series]
-        title = (series[0][2].get("title") or "")[:45].strip()
-        label = title + ("…" if len(series[0][2].get("title") or "") > 45 else "")
-        plt.plot(x, y, label=label)
+    for post_name, g in non_groups:
+        full_title = g["title"].iat[0]
+        label = full_title[:45].strip() + ("…" if len(full_title) > 45 else "")
+        plt.plot(g["snapshot_utc"], g["num_comments"], label=label)
         plotted_any = True
 
     if plotted_any:
@@ -461,9 +657,9 @@ def write_dashboard_html(all_posts: List[Post], eps: List[Post], trailer: Option
         return f"""
         <tr>
           <td>{kind}</td>
-          <td>{p.subreddit}</td>
-          <td>{ep}</td>
-          <td><a href="{p.permalink}" target="_blank" rel="noopener">{p.title}</a></td>
+          <td>{escape(p.subreddit)}</td>
+          <td>{escape(ep)}</td>
+          <td><a href="{escape(p.permalink)}" target="_blank" rel="noopener">{escape(p.title)}</a></td>
           <td style="text-align:right">{p.num_comments}</td>
           <td style="text-align:right">{p.score}</td>
           <td>{p.created_iso}</td>
@@ -478,8 +674,8 @@ def write_dashboard_html(all_posts: List[Post], eps: List[Post], trailer: Option
           <thead><tr><th>Title</th><th>Subreddit</th><th>Comments</th><th>Score</th><th>Created (UTC)</th></tr></thead>
           <tbody>
             <tr>
-              <td><a href="{trailer.permalink}" target="_blank" rel="noopener">{trailer.title}</a></td>
-              <td>r/{trailer.subreddit}</td>
+              <td><a href="{escape(trailer.permalink)}" target="_blank" rel="noopener">{escape(trailer.title)}</a></td>
+              <td>r/{escape(trailer.subreddit)}</td>
               <td style="text-align:right">{trailer.num_comments}</td>
               <td style="text-align:right">{trailer.score}</td>
               <td>{trailer.created_iso}</td>
@@ -488,8 +684,15 @@ def write_dashboard_html(all_posts: List[Post], eps: List[Post], trailer: Option
         </table>
         """
 
-    eps_rows = "\n".join(row_for(p) for p in eps)
-    others_rows = "\n".join(row_for(p) for p in others)
+    eps_parts = []
+    for p in eps:
+        eps_parts.append(row_for(p))
+    eps_rows = "\n".join(eps_parts)
+
+    others_parts = []
+    for p in others:
+        others_parts.append(row_for(p))
+    others_rows = "\n".join(others_parts)
 
     # quick stats
     total_posts = len(all_posts)
@@ -501,7 +704,7 @@ def write_dashboard_html(all_posts: List[Post], eps: List[Post], trailer: Option
 <html>
 <head>
   <meta charset="utf-8" />
-  <title>RewindOS: {SHOW_NAME} Reddit tracker</title>
+  <title>RewindOS: {escape(SHOW_NAME)} Reddit tracker</title>
   <style>
     body {{ font-family: system-ui, Arial, sans-serif; margin: 24px; }}
     .muted {{ color: #666; }}
@@ -516,11 +719,11 @@ def write_dashboard_html(all_posts: List[Post], eps: List[Post], trailer: Option
   </style>
 </head>
 <body>
-  <h1>{SHOW_NAME}: Reddit tracking</h1>
+  <h1>{escape(SHOW_NAME)}: Reddit tracking</h1>
   <p class="muted">
-    Subreddits: <code>{", ".join("r/" + s for s in SUBREDDITS)}</code><br/>
-    Query terms: <code>{", ".join(QUERY_TERMS)}</code><br/>
-    Generated: <code>{utc_now_iso()}</code> · Sort: <code>{SORT}</code> · Time filter: <code>{TIME_FILTER}</code><br/>
+    Subreddits: <code>{escape(", ".join("r/" + s for s in SUBREDDITS))}</code><br/>
+    Query terms: <code>{escape(", ".join(QUERY_TERMS))}</code><br/>
+    Generated: <code>{utc_now_iso()}</code> · Sort: <code>{escape(SORT)}</code> · Time filter: <code>{escape(TIME_FILTER)}</code><br/>
     Data source: Reddit public JSON search endpoint (no OAuth key).
   </p>
 
@@ -585,42 +788,42 @@ def write_dashboard_html(all_posts: List[Post], eps: List[Post], trailer: Option
 # -----------------------------
 def main():
     snapshot = utc_now_iso()
-    posts = fetch_search_posts()
+    cursor = load_cursor() if INCREMENTAL else None
+    posts = fetch_search_posts(cursor)
 
     # All posts CSV
-    all_rows = [{
-        "id": p.id,
-        "subreddit": p.subreddit,
-        "created_utc": p.created_utc,
-        "created_iso": p.created_iso,
-        "title": p.title,
-        "episode_code": p.episode_code or "",
-        "is_trailer": 1 if p.is_trailer else 0,
-        "num_comments": p.num_comments,
-        "score": p.score,
-        "author": p.author,
-        "permalink": p.permalink,
-        "url": p.url,
-    } for p in posts]
+    all_rows = [(
+        p.id,
+        p.subreddit,
+        p.created_utc,
+        p.created_iso,
+        p.title,
+        p.episode_code or "",
+        1 if p.is_trailer else 0,
+        p.num_comments,
+        p.score,
+        p.author,
+        p.permalink,
+        p.url,
+    ) for p in posts]
     write_csv(
         ALL_POSTS_CSV,
         all_rows,
-        list(all_rows[0].keys()) if all_rows else
         ["id","subreddit","created_utc","created_iso","title","episode_code","is_trailer","num_comments","score","author","permalink","url"]
     )
 
     # Episode posts CSV
     eps = episode_posts(posts)
-    eps_rows = [{
-        "episode_code": p.episode_code or "",
-        "subreddit": p.subreddit,
-        "id": p.id,
-        "created_iso": p.created_iso,
-        "title": p.title,
-        "num_comments": p.num_comments,
-        "score": p.score,
-        "permalink": p.permalink,
-    } for p in eps]
+    eps_rows = [(
+        p.episode_code or "",
+        p.subreddit,
+        p.id,
+        p.created_iso,
+        p.title,
+        p.num_comments,
+        p.score,
+        p.permalink,
+    ) for p in eps]
     write_csv(EPISODE_POSTS_CSV, eps_rows, ["episode_code","subreddit","id","created_iso","title","num_comments","score","permalink"])
 
     # Selected posts CSV (Trailer + top N others)
@@ -632,21 +835,23 @@ def main():
         selected.append(trailer)
     selected.extend(others)
 
-    sel_rows = [{
-        "type": ("Trailer" if p.is_trailer else ("Episode" if p.episode_code else "Other")),
-        "subreddit": p.subreddit,
-        "episode_code": p.episode_code or "",
-        "id": p.id,
-        "created_iso": p.created_iso,
-        "title": p.title,
-        "num_comments": p.num_comments,
-        "score": p.score,
-        "permalink": p.permalink,
-    } for p in selected]
+    sel_rows = [(
+        "Trailer" if p.is_trailer else ("Episode" if p.episode_code else "Other"),
+        p.subreddit,
+        p.episode_code or "",
+        p.id,
+        p.created_iso,
+        p.title,
+        p.num_comments,
+        p.score,
+        p.permalink,
+    ) for p in selected]
     write_csv(SELECTED_POSTS_CSV, sel_rows, ["type","subreddit","episode_code","id","created_iso","title","num_comments","score","permalink"])
 
     # History + plots + dashboard
     append_history(snapshot, posts)
+    if cursor is not None:
+        save_cursor(cursor)
     make_plots()
     write_dashboard_html(posts, eps, trailer, others)
 